@@ -1,9 +1,14 @@
 """Create command - scaffold new services and resources."""
 
+import shutil
+
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
+
+from finops.terraform import NAME_PATTERN, RESOURCE_MODULES, plan_resources
 
 console = Console()
 
@@ -94,10 +99,82 @@ def service(name: str, template: str, description: str, team: str, output: str)
     console.print("  3. Open http://localhost:8000/docs")
 
 
+def validate_resource_names(
+    ctx: click.Context, param: click.Parameter, value: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Check resource names are usable as workspace and module names, dropping duplicates."""
+    for name in value:
+        if not NAME_PATTERN.match(name):
+            raise click.BadParameter(
+                f"'{name}' must start with a letter and contain only a-z, 0-9 and '-'"
+            )
+    return tuple(dict.fromkeys(value))
+
+
 @create.command()
-@click.argument("name")
-@click.option("--type", "resource_type", type=click.Choice(["database", "cache", "queue", "storage"]))
-def resource(name: str, resource_type: str) -> None:
-    """Create a new infrastructure resource."""
-    console.print(f"\n[bold blue]🔧 Creating {resource_type}: {name}[/bold blue]\n")
-    console.print(f"[green]✓ Resource '{name}' configuration created![/green]")
+@click.argument("names", nargs=-1, required=True, callback=validate_resource_names)
+@click.option(
+    "--type",
+    "resource_type",
+    type=click.Choice(list(RESOURCE_MODULES.keys())),
+    required=True,
+    help="Resource type",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Maximum number of concurrent Terraform plans",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show Terraform output for failed plans")
+def resource(names: tuple[str, ...], resource_type: str, jobs: int, verbose: bool) -> None:
+    """
+    Create new infrastructure resources.
+
+    Generates a Terraform workspace per resource and runs `terraform plan` in it.
+    Workspaces and provider plugins are cached in ~/.finops/cache/terraform.
+
+    \b
+    Example:
+      $ finops create resource orders-db --type database
+      $ finops create resource sessions quotes rates --type cache -j 2
+    """
+    if not shutil.which("terraform"):
+        console.print("[red]❌ Terraform not found[/red] - run [cyan]finops doctor[/cyan]")
+        raise SystemExit(1)
+
+    console.print(f"\n[bold blue]🔧 Planning {resource_type}: {', '.join(names)}[/bold blue]\n")
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        progress.add_task(f"Running terraform plan ({min(jobs, len(names))} parallel)...")
+        results = plan_resources(list(names), resource_type, jobs)
+
+    table = Table()
+    table.add_column("Resource", style="cyan")
+    table.add_column("Status")
+    table.add_column("Plan")
+    table.add_column("Workspace", style="dim")
+
+    for result in results:
+        status = "[green]✅ Planned[/green]" if result.ok else "[red]❌ Failed[/red]"
+        table.add_row(result.name, status, result.summary, str(result.workspace))
+
+    console.print(table)
+
+    failed = [result for result in results if not result.ok]
+    if verbose:
+        for result in failed:
+            console.print(f"\n[bold red]{result.name}:[/bold red]")
+            console.print(result.output, markup=False)
+
+    if failed:
+        console.print(f"\n[red]✗ {len(failed)} of {len(results)} plan(s) failed[/red]")
+        raise SystemExit(1)
+
+    console.print(f"\n[green]✓ Configuration for {len(results)} resource(s) created![/green]")
+    console.print("Next: run [bold]terraform apply tfplan[/bold] in each workspace")
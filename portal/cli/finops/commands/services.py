@@ -1,11 +1,145 @@
 """Services command - manage platform services."""
 
+import math
+import re
+import struct
+
 import click
+import httpx
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
+from finops.metrics import SeriesCache
+
 console = Console()
 
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+ENVIRONMENTS = ("dev", "staging", "prod")
+
+# PromQL per metric: (query template, formatter for the latest value).
+# Templates take label-escaped `env`/`name` and a regex-escaped `name_re`.
+METRIC_QUERIES = {
+    "CPU": (
+        "sum(rate(container_cpu_usage_seconds_total"
+        '{{namespace="{env}", pod=~"{name_re}-.*"}}[5m]))',
+        lambda v: f"{v:.2f} cores",
+    ),
+    "Memory": (
+        'sum(container_memory_working_set_bytes{{namespace="{env}", pod=~"{name_re}-.*"}})',
+        lambda v: f"{v / 2**20:.0f} MiB",
+    ),
+    "Requests": (
+        'sum(rate(http_requests_total{{namespace="{env}", service="{name}"}}[5m]))',
+        lambda v: f"{v:.1f} req/s",
+    ),
+    "p95 Latency": (
+        "histogram_quantile(0.95, sum by (le) (rate("
+        'http_request_duration_seconds_bucket{{namespace="{env}", service="{name}"}}[5m])))',
+        lambda v: f"{v * 1000:.0f} ms",
+    ),
+}
+
+
+def promql_string(value: str) -> str:
+    """Escape a value for use inside a double-quoted PromQL string."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def metric_queries(name: str, env: str) -> list[tuple[str, str]]:
+    """Return (metric, PromQL) pairs for a service in one environment."""
+    labels = {
+        "env": promql_string(env),
+        "name": promql_string(name),
+        "name_re": promql_string(re.escape(name)),
+    }
+    return [(metric, query.format(**labels)) for metric, (query, _) in METRIC_QUERIES.items()]
+
+
+def sparkline(values: list[float], width: int = 24) -> str:
+    """Render values as a unicode sparkline, averaging them into ``width`` buckets."""
+    values = [v for v in values if math.isfinite(v)]
+    if not values:
+        return ""
+    size = max(1, -(-len(values) // width))
+    chunks = [values[i : i + size] for i in range(0, len(values), size)]
+    buckets = [sum(chunk) / len(chunk) for chunk in chunks]
+    low, high = min(buckets), max(buckets)
+    scale = (len(SPARK_BLOCKS) - 1) / (high - low) if high > low else 0
+    return "".join(SPARK_BLOCKS[int((v - low) * scale)] for v in buckets)
+
+
+def collect_metrics(
+    cache: SeriesCache, name: str, window: int, step: int, refresh: bool
+) -> tuple[dict[str, list[str]], dict[str, str], list[str]]:
+    """
+    Query every metric for every environment through the cache.
+
+    Returns the rendered table cells and a status per environment, plus
+    messages explaining any failures.
+    """
+    cells: dict[str, list[str]] = {}
+    statuses: dict[str, str] = {}
+    errors: set[str] = set()
+    available = True
+
+    for env in ENVIRONMENTS:
+        row = []
+        reporting = failed = 0
+        for metric, query in metric_queries(name, env):
+            fmt = METRIC_QUERIES[metric][1]
+            if not available:
+                row.append("[red]unavailable[/red]")
+                failed += 1
+                continue
+            try:
+                if refresh:
+                    cache.drop(query, step)
+                samples = cache.recent(query, window * 3600, step)
+            except httpx.HTTPStatusError as e:
+                errors.add(f"Prometheus returned HTTP {e.response.status_code}")
+                row.append("[red]unavailable[/red]")
+                failed += 1
+                continue
+            except httpx.HTTPError:
+                # Don't wait on every remaining query once Prometheus is unreachable
+                available = False
+                row.append("[red]unavailable[/red]")
+                failed += 1
+                continue
+            except (ValueError, KeyError, TypeError) as e:
+                errors.add(f"Unexpected Prometheus response: {e!r}")
+                row.append("[red]unavailable[/red]")
+                failed += 1
+                continue
+            except (OSError, struct.error) as e:
+                errors.add(f"Metrics cache error: {e} - try --refresh")
+                row.append("[red]unavailable[/red]")
+                failed += 1
+                continue
+
+            values = [value for _, value in samples if not math.isnan(value)]
+            if not values:
+                row.append("[dim]no data[/dim]")
+                continue
+            reporting += 1
+            latest = fmt(values[-1]) if math.isfinite(values[-1]) else "n/a"
+            row.append(f"[green]{sparkline(values)}[/green] {latest}")
+
+        cells[env] = row
+        if reporting:
+            statuses[env] = "✅ Reporting"
+        elif failed:
+            statuses[env] = "[red]❌ Unavailable[/red]"
+        else:
+            statuses[env] = "[dim]⚪ No data[/dim]"
+
+    messages = sorted(errors)
+    if not available:
+        messages.insert(0, "Prometheus unreachable - set FINOPS_PROMETHEUS_URL")
+    return cells, statuses, messages
+
 
 @click.group()
 def services() -> None:
@@ -57,13 +191,24 @@ def list_services(team: str | None, env: str | None) -> None:
 
 @services.command()
 @click.argument("name")
-def describe(name: str) -> None:
+@click.option(
+    "--window", "-w", type=click.IntRange(min=1), default=6, help="Metrics window in hours"
+)
+@click.option(
+    "--step", type=click.IntRange(min=1), default=60, help="Metrics resolution in seconds"
+)
+@click.option("--refresh", is_flag=True, help="Discard this service's cached metrics first")
+def describe(name: str, window: int, step: int, refresh: bool) -> None:
     """
     Show detailed information about a service.
 
+    Metrics are cached locally in ~/.finops/cache/metrics; only samples newer
+    than the cache are fetched from Prometheus.
+
     \b
     Example:
       $ finops services describe trading-api
+      $ finops services describe trading-api --window 24 --step 300
     """
     console.print(f"\n[bold blue]📊 Service: {name}[/bold blue]\n")
 
@@ -81,6 +226,9 @@ def describe(name: str) -> None:
 
     console.print(info_table)
 
+    # Resource metrics, also used for the deployment status
+    cells, statuses, messages = collect_metrics(SeriesCache(), name, window, step, refresh)
+
     # Deployments table
     console.print("\n[bold]Deployments:[/bold]")
     deploy_table = Table()
@@ -90,12 +238,28 @@ def describe(name: str) -> None:
     deploy_table.add_column("Status")
     deploy_table.add_column("URL")
 
-    deploy_table.add_row("dev", "v1.2.3", "2/2", "✅ Healthy", f"https://{name}.dev.example.com")
-    deploy_table.add_row("staging", "v1.2.3", "2/2", "✅ Healthy", f"https://{name}.staging.example.com")
-    deploy_table.add_row("prod", "v1.2.2", "3/3", "✅ Healthy", f"https://{name}.example.com")
+    deployments = [
+        ("dev", "v1.2.3", "2/2", f"https://{name}.dev.example.com"),
+        ("staging", "v1.2.3", "2/2", f"https://{name}.staging.example.com"),
+        ("prod", "v1.2.2", "3/3", f"https://{name}.example.com"),
+    ]
+    for env, version, replicas, url in deployments:
+        deploy_table.add_row(env, version, replicas, statuses[env], url)
 
     console.print(deploy_table)
 
+    console.print(f"\n[bold]Metrics (last {window}h):[/bold]")
+    metrics_table = Table()
+    metrics_table.add_column("Environment")
+    for metric in METRIC_QUERIES:
+        metrics_table.add_column(metric)
+    for env in ENVIRONMENTS:
+        metrics_table.add_row(env, *cells[env])
+
+    console.print(metrics_table)
+    for message in messages:
+        console.print(f"[dim]{escape(message)}[/dim]")
+
     # Dependencies
     console.print("\n[bold]Dependencies:[/bold]")
     console.print("  • PostgreSQL 15 (managed)")
@@ -0,0 +1,208 @@
+"""Metrics - local time-series cache for Prometheus range queries.
+
+Each cached series is stored as two column files under ``~/.finops/cache/metrics``:
+
+  <key>.ts   32-byte header (covered_from, covered_to, first_ts, last_ts as int64)
+             followed by one uint32 delta per sample (seconds since the previous one)
+  <key>.val  one float32 value per sample
+
+Files are read through ``mmap`` and only the missing tail of a requested window is
+fetched from Prometheus, so repeated ``describe`` calls reuse the samples on disk.
+The last few steps are always re-fetched, since Prometheus may not have finished
+ingesting them yet.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable
+from itertools import accumulate
+from pathlib import Path
+
+import httpx
+
+PROMETHEUS_URL = os.environ.get("FINOPS_PROMETHEUS_URL", "http://localhost:9090")
+CACHE_DIR = Path(os.environ.get("FINOPS_CACHE_DIR", Path.home() / ".finops" / "cache")) / "metrics"
+
+HEADER = struct.Struct("<qqqq")
+
+# Steps before the end of a fetched window that are re-fetched on the next call
+LOOKBACK_STEPS = 3
+
+Fetch = Callable[[str, int, int, int], list[tuple[int, float]]]
+Header = tuple[int, int, int, int]
+
+
+def _encode(prev: int, samples: list[tuple[int, float]]) -> tuple[array, array]:
+    """Split samples into delta-encoded uint32 timestamps and float32 values."""
+    deltas = array("I")
+    values = array("f")
+    for ts, value in samples:
+        deltas.append(ts - prev)
+        values.append(value)
+        prev = ts
+    return deltas, values
+
+
+def query_range(query: str, start: int, end: int, step: int) -> list[tuple[int, float]]:
+    """Run a Prometheus range query and return the samples of the first series."""
+    response = httpx.get(
+        f"{PROMETHEUS_URL}/api/v1/query_range",
+        params={"query": query, "start": start, "end": end, "step": step},
+        timeout=10,
+    )
+    response.raise_for_status()
+    result = response.json()["data"]["result"]
+    if not result:
+        return []
+    return [(int(float(ts)), float(value)) for ts, value in result[0]["values"]]
+
+
+class SeriesCache:
+    """Array-backed on-disk cache of Prometheus range-query results."""
+
+    def __init__(
+        self,
+        root: Path = CACHE_DIR,
+        fetch: Fetch = query_range,
+        source: str = PROMETHEUS_URL,
+    ) -> None:
+        self.root = root
+        self.fetch = fetch
+        self.source = source
+
+    def _paths(self, query: str, step: int) -> tuple[Path, Path]:
+        key = hashlib.sha1(f"{self.source}|{query}|{step}".encode()).hexdigest()
+        return self.root / f"{key}.ts", self.root / f"{key}.val"
+
+    def _read(self, query: str, step: int) -> tuple[Header | None, array]:
+        """Return the header and decoded timestamps, trimmed to the shorter column."""
+        ts_path, val_path = self._paths(query, step)
+        if not ts_path.exists() or not val_path.exists():
+            return None, array("q")
+
+        with open(ts_path, "rb") as ts_file:
+            header: Header = HEADER.unpack(ts_file.read(HEADER.size))
+            timestamps = array("q")
+            if os.fstat(ts_file.fileno()).st_size > HEADER.size:
+                with mmap.mmap(ts_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)[HEADER.size :]
+                    deltas = view[: len(view) // 4 * 4].cast("I")
+                    timestamps = array("q", accumulate(deltas, initial=header[2]))[1:]
+                    deltas.release()
+                    view.release()
+
+        # A write interrupted between the two columns leaves one of them longer
+        count = min(len(timestamps), val_path.stat().st_size // 4)
+        return header, timestamps[:count]
+
+    def _values(self, query: str, step: int, lo: int, hi: int) -> list[float]:
+        """Read values ``[lo, hi)`` from the value column without loading the rest."""
+        if lo >= hi:
+            return []
+        _, val_path = self._paths(query, step)
+        with open(val_path, "rb") as val_file:
+            with mmap.mmap(val_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                values = array("f")
+                values.frombytes(mm[lo * 4 : hi * 4])
+        return values.tolist()
+
+    def _write(
+        self,
+        query: str,
+        step: int,
+        covered: tuple[int, int],
+        samples: list[tuple[int, float]],
+    ) -> None:
+        """Rewrite a series from scratch."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        ts_path, val_path = self._paths(query, step)
+        first = samples[0][0] if samples else 0
+        last = samples[-1][0] if samples else 0
+
+        deltas, values = _encode(first, samples)
+
+        for path, payload in (
+            (val_path, values.tobytes()),
+            (ts_path, HEADER.pack(*covered, first, last) + deltas.tobytes()),
+        ):
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_bytes(payload)
+            tmp_path.replace(path)
+
+    def _append(
+        self,
+        query: str,
+        step: int,
+        covered: tuple[int, int],
+        timestamps: array,
+        keep: int,
+        samples: list[tuple[int, float]],
+    ) -> None:
+        """Keep the first ``keep`` cached samples, then append ``samples`` after them."""
+        ts_path, val_path = self._paths(query, step)
+        first = timestamps[0] if keep else (samples[0][0] if samples else 0)
+        last = timestamps[keep - 1] if keep else first
+        deltas, values = _encode(last, samples)
+
+        with open(val_path, "r+b") as val_file:
+            val_file.truncate(keep * 4)
+            val_file.seek(0, os.SEEK_END)
+            val_file.write(values.tobytes())
+        with open(ts_path, "r+b") as ts_file:
+            ts_file.truncate(HEADER.size + keep * 4)
+            ts_file.seek(0, os.SEEK_END)
+            ts_file.write(deltas.tobytes())
+            ts_file.seek(0)
+            ts_file.write(HEADER.pack(*covered, first, samples[-1][0] if samples else last))
+
+    def range(self, query: str, start: int, end: int, step: int) -> list[tuple[int, float]]:
+        """
+        Return samples for ``query`` in ``[start, end]``.
+
+        Only the part of the window not already on disk is requested from Prometheus.
+        Windows that do not overlap the cache are re-fetched in full, and history
+        older than the requested window is dropped once it outgrows it.
+        """
+        header, timestamps = self._read(query, step)
+        settled = max(start, end - LOOKBACK_STEPS * step)
+
+        if header is None or start < header[0] or start > header[1] + step:
+            samples = self.fetch(query, start, end, step)
+            self._write(query, step, (start, settled), samples)
+            return samples
+
+        covered_from, covered_to = header[0], header[1]
+        lo = bisect_left(timestamps, start)
+        if end <= covered_to:
+            hi = bisect_left(timestamps, end + 1)
+            values = self._values(query, step, lo, hi)
+            return list(zip(timestamps[lo:hi], values, strict=True))
+
+        fetch_from = covered_to + step
+        tail = self.fetch(query, fetch_from, end, step)
+        keep = bisect_left(timestamps, fetch_from)
+        cached = list(zip(timestamps[lo:keep], self._values(query, step, lo, keep), strict=True))
+        covered = (covered_from, max(covered_to, settled))
+
+        if timestamps and timestamps[0] < start - (end - start):
+            # Cached history is more than twice the window; compact to the window
+            self._write(query, step, (start, covered[1]), cached + tail)
+        else:
+            self._append(query, step, covered, timestamps, keep, tail)
+
+        return cached + [(ts, value) for ts, value in tail if start <= ts <= end]
+
+    def recent(self, query: str, window: int, step: int) -> list[tuple[int, float]]:
+        """Return the last ``window`` seconds of samples, aligned to ``step``."""
+        end = int(time.time()) // step * step
+        return self.range(query, end - window, end, step)
+
+    def drop(self, query: str, step: int) -> None:
+        """Remove the cached series for ``query`` at ``step``."""
+        for path in self._paths(query, step):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,218 @@
+"""Terraform - generate and plan infrastructure resource workspaces.
+
+Every resource gets its own workspace under ``~/.finops/cache/terraform/workspaces``
+that is kept between runs, so ``terraform init`` is only repeated when the generated
+configuration changes. All workspaces share one provider plugin cache, and
+``FINOPS_TF_PROVIDER_MIRROR`` makes Terraform install providers from a local
+filesystem mirror instead of the registry. Planning still needs AWS credentials.
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = (
+    Path(os.environ.get("FINOPS_CACHE_DIR", Path.home() / ".finops" / "cache")) / "terraform"
+)
+WORKSPACE_DIR = CACHE_DIR / "workspaces"
+PLUGIN_CACHE_DIR = Path(os.environ.get("TF_PLUGIN_CACHE_DIR", CACHE_DIR / "plugins"))
+PROVIDER_MIRROR = os.environ.get("FINOPS_TF_PROVIDER_MIRROR")
+MODULES_DIR = os.environ.get("FINOPS_TF_MODULES_DIR")
+AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
+
+# Resource names double as workspace directories and Terraform module labels
+NAME_PATTERN = re.compile(r"^[a-z][a-z0-9-]*$")
+
+
+@dataclass(frozen=True)
+class ResourceModule:
+    """Terraform module used to provision one resource type."""
+
+    source: str
+    version: str
+    inputs: Callable[[str], dict[str, Any]]
+
+
+RESOURCE_MODULES = {
+    "database": ResourceModule(
+        source="terraform-aws-modules/rds/aws",
+        version="~> 6.0",
+        inputs=lambda name: {
+            "identifier": name,
+            "db_name": name.replace("-", "_"),
+            "username": "finops",
+            "manage_master_user_password": True,
+            "engine": "postgres",
+            "engine_version": "15",
+            "family": "postgres15",
+            "major_engine_version": "15",
+            "instance_class": "db.t4g.micro",
+            "allocated_storage": 20,
+        },
+    ),
+    "cache": ResourceModule(
+        source="terraform-aws-modules/elasticache/aws",
+        version="~> 1.0",
+        # The module builds a replication group unless told to create a plain cluster
+        inputs=lambda name: {
+            "cluster_id": name,
+            "create_cluster": True,
+            "create_replication_group": False,
+            "engine": "redis",
+            "engine_version": "7.1",
+            "node_type": "cache.t4g.micro",
+            "num_cache_nodes": 1,
+            "parameter_group_family": "redis7",
+            "create_subnet_group": False,
+        },
+    ),
+    "queue": ResourceModule(
+        source="terraform-aws-modules/sqs/aws",
+        version="~> 4.0",
+        inputs=lambda name: {"name": name},
+    ),
+    "storage": ResourceModule(
+        source="terraform-aws-modules/s3-bucket/aws",
+        version="~> 4.0",
+        inputs=lambda name: {"bucket": name},
+    ),
+}
+
+# Terraform's plugin cache is not safe for concurrent writes, so inits run one at a time
+_init_lock = threading.Lock()
+
+
+@dataclass
+class PlanResult:
+    """Outcome of planning a single resource workspace."""
+
+    name: str
+    workspace: Path
+    ok: bool
+    summary: str
+    output: str = ""
+
+
+def render_config(name: str, resource_type: str) -> dict[str, Any]:
+    """Build the Terraform JSON configuration for a resource."""
+    module = RESOURCE_MODULES[resource_type]
+    block: dict[str, Any] = {}
+    if MODULES_DIR:
+        block["source"] = str(Path(MODULES_DIR) / resource_type)
+    else:
+        block["source"] = module.source
+        block["version"] = module.version
+    block.update(module.inputs(name))
+    block["tags"] = {"Name": name, "ManagedBy": "finops"}
+
+    return {
+        "terraform": {
+            "required_providers": {"aws": {"source": "hashicorp/aws", "version": "~> 5.0"}},
+        },
+        "provider": {"aws": {"region": AWS_REGION}},
+        "module": {name.replace("-", "_"): block},
+    }
+
+
+def terraform_env() -> dict[str, str]:
+    """Environment for Terraform processes with the shared plugin cache and mirror."""
+    PLUGIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ, TF_PLUGIN_CACHE_DIR=str(PLUGIN_CACHE_DIR), TF_IN_AUTOMATION="1")
+
+    if PROVIDER_MIRROR:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cli_config = CACHE_DIR / "terraformrc"
+        cli_config.write_text(
+            "provider_installation {\n"
+            f"  filesystem_mirror {{\n    path = {json.dumps(PROVIDER_MIRROR)}\n  }}\n"
+            "}\n"
+        )
+        env["TF_CLI_CONFIG_FILE"] = str(cli_config)
+    return env
+
+
+def workspace_path(name: str, resource_type: str) -> Path:
+    """Return the workspace directory for a resource."""
+    if not NAME_PATTERN.match(name):
+        raise ValueError(f"invalid resource name: {name!r}")
+    return WORKSPACE_DIR / f"{resource_type}-{name}"
+
+
+def prepare_workspace(name: str, resource_type: str) -> tuple[Path, str | None]:
+    """
+    Write the configuration for a resource into its workspace.
+
+    Returns the workspace path and, if ``terraform init`` needs to run, the
+    configuration digest to record once it succeeds.
+    """
+    workspace = workspace_path(name, resource_type)
+    workspace.mkdir(parents=True, exist_ok=True)
+
+    config = json.dumps(render_config(name, resource_type), indent=2, sort_keys=True)
+    digest = hashlib.sha256(config.encode()).hexdigest()
+    stamp = workspace / ".finops-init"
+
+    (workspace / "main.tf.json").write_text(config)
+    if (workspace / ".terraform").exists() and stamp.exists() and stamp.read_text() == digest:
+        return workspace, None
+    return workspace, digest
+
+
+def plan_resource(name: str, resource_type: str, env: dict[str, str]) -> PlanResult:
+    """Initialise (if needed) and plan a single resource workspace."""
+    workspace, digest = prepare_workspace(name, resource_type)
+
+    if digest:
+        with _init_lock:
+            result = subprocess.run(
+                ["terraform", "init", "-input=false", "-no-color"],
+                cwd=workspace,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+        if result.returncode != 0:
+            return PlanResult(name, workspace, False, "init failed", result.stderr)
+        (workspace / ".finops-init").write_text(digest)
+
+    result = subprocess.run(
+        ["terraform", "plan", "-input=false", "-no-color", "-detailed-exitcode", "-out=tfplan"],
+        cwd=workspace,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    # -detailed-exitcode: 0 no changes, 2 changes; anything else (incl. signals) failed
+    if result.returncode not in (0, 2):
+        return PlanResult(name, workspace, False, "plan failed", result.stderr or result.stdout)
+
+    match = re.search(r"Plan: .*", result.stdout)
+    summary = match.group(0) if match else "No changes."
+    return PlanResult(name, workspace, True, summary, result.stdout)
+
+
+def plan_resources(names: list[str], resource_type: str, jobs: int) -> list[PlanResult]:
+    """
+    Plan several resources concurrently, running at most ``jobs`` Terraform processes.
+
+    Names are deduplicated so no two plans share a workspace.
+    """
+    env = terraform_env()
+
+    def plan(name: str) -> PlanResult:
+        try:
+            return plan_resource(name, resource_type, env)
+        except (OSError, ValueError) as e:
+            workspace = WORKSPACE_DIR / f"{resource_type}-{name}"
+            return PlanResult(name, workspace, False, "error", str(e))
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return list(pool.map(plan, dict.fromkeys(names)))
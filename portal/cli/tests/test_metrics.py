@@ -0,0 +1,116 @@
+"""Tests for the Prometheus time-series cache."""
+
+from pathlib import Path
+
+import pytest
+
+from finops.metrics import HEADER, LOOKBACK_STEPS, SeriesCache
+
+STEP = 60
+
+
+class FakePrometheus:
+    """Range-query stand-in that records every call."""
+
+    def __init__(self, until: int | None = None) -> None:
+        self.calls: list[tuple[int, int]] = []
+        self.until = until
+        self.overrides: dict[int, float] = {}
+
+    def __call__(self, query: str, start: int, end: int, step: int) -> list[tuple[int, float]]:
+        self.calls.append((start, end))
+        first = -(-start // step) * step
+        last = end if self.until is None else min(end, self.until)
+        return [(ts, self.overrides.get(ts, ts / step)) for ts in range(first, last + 1, step)]
+
+
+def expected(start: int, end: int) -> list[tuple[int, float]]:
+    return [(ts, ts / STEP) for ts in range(start, end + 1, STEP)]
+
+
+@pytest.fixture
+def prometheus() -> FakePrometheus:
+    return FakePrometheus()
+
+
+@pytest.fixture
+def cache(tmp_path: Path, prometheus: FakePrometheus) -> SeriesCache:
+    return SeriesCache(tmp_path, prometheus, source="http://prometheus:9090")
+
+
+def test_first_call_fetches_full_window(cache: SeriesCache, prometheus: FakePrometheus) -> None:
+    assert cache.range("up", 6000, 12000, STEP) == expected(6000, 12000)
+    assert prometheus.calls == [(6000, 12000)]
+
+
+def test_round_trip_refetches_only_lookback(
+    cache: SeriesCache, prometheus: FakePrometheus
+) -> None:
+    cache.range("up", 6000, 12000, STEP)
+
+    assert cache.range("up", 6000, 12000, STEP) == expected(6000, 12000)
+    assert prometheus.calls[1] == (12000 - (LOOKBACK_STEPS - 1) * STEP, 12000)
+
+
+def test_later_window_fetches_only_tail(cache: SeriesCache, prometheus: FakePrometheus) -> None:
+    cache.range("up", 6000, 12000, STEP)
+
+    assert cache.range("up", 6600, 12600, STEP) == expected(6600, 12600)
+    assert prometheus.calls[1] == (12000 - (LOOKBACK_STEPS - 1) * STEP, 12600)
+
+
+def test_lookback_replaces_unsettled_samples(tmp_path: Path) -> None:
+    prometheus = FakePrometheus(until=11940)
+    prometheus.overrides[11940] = -1.0
+    cache = SeriesCache(tmp_path, prometheus)
+    cache.range("up", 6000, 12000, STEP)
+
+    prometheus.until = None
+    prometheus.overrides.clear()
+
+    assert cache.range("up", 6000, 12000, STEP) == expected(6000, 12000)
+    prometheus.calls.clear()
+    assert cache.range("up", 6000, 11700, STEP) == expected(6000, 11700)
+    assert prometheus.calls == []
+
+
+def test_empty_first_fetch_is_filled_later(tmp_path: Path) -> None:
+    prometheus = FakePrometheus(until=0)
+    cache = SeriesCache(tmp_path, prometheus)
+    assert cache.range("up", 6000, 12000, STEP) == []
+
+    prometheus.until = None
+    tail_start = 12000 - (LOOKBACK_STEPS - 1) * STEP
+    assert cache.range("up", 6000, 12600, STEP) == expected(tail_start, 12600)
+
+
+def test_earlier_start_refetches_window(cache: SeriesCache, prometheus: FakePrometheus) -> None:
+    cache.range("up", 6000, 12000, STEP)
+
+    assert cache.range("up", 3000, 12000, STEP) == expected(3000, 12000)
+    assert prometheus.calls[1] == (3000, 12000)
+
+
+def test_mismatched_columns_are_repaired(cache: SeriesCache) -> None:
+    cache.range("up", 6000, 12000, STEP)
+    ts_path, val_path = cache._paths("up", STEP)
+    with open(val_path, "ab") as val_file:
+        val_file.write(b"\0" * 12)
+
+    assert cache.range("up", 6000, 12000, STEP) == expected(6000, 12000)
+    assert (ts_path.stat().st_size - HEADER.size) == val_path.stat().st_size
+
+
+def test_history_is_compacted_to_window(cache: SeriesCache) -> None:
+    for end in range(12000, 60000, 1200):
+        assert cache.range("up", end - 6000, end, STEP) == expected(end - 6000, end)
+
+    _, val_path = cache._paths("up", STEP)
+    assert val_path.stat().st_size <= 2 * (6000 // STEP + 1) * 4
+
+
+def test_cache_is_keyed_by_source(tmp_path: Path, prometheus: FakePrometheus) -> None:
+    SeriesCache(tmp_path, prometheus, source="http://a").range("up", 6000, 12000, STEP)
+    SeriesCache(tmp_path, prometheus, source="http://b").range("up", 6000, 12000, STEP)
+
+    assert prometheus.calls == [(6000, 12000), (6000, 12000)]
@@ -0,0 +1,88 @@
+"""Tests for the services commands."""
+
+import math
+from pathlib import Path
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from finops.commands import services
+from finops.metrics import SeriesCache
+
+
+class FakePrometheus:
+    """Range-query stand-in returning +Inf for latency quantiles."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.fail = False
+
+    def __call__(self, query: str, start: int, end: int, step: int) -> list[tuple[int, float]]:
+        if self.fail:
+            raise httpx.ConnectError("connection refused")
+        self.queries.append(query)
+        value = math.inf if query.startswith("histogram_quantile") else 1.0
+        first = -(-start // step) * step
+        return [(ts, value) for ts in range(first, end + 1, step)]
+
+
+@pytest.fixture
+def prometheus(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakePrometheus:
+    fake = FakePrometheus()
+    monkeypatch.setattr(services, "SeriesCache", lambda: SeriesCache(tmp_path, fake))
+    return fake
+
+
+def describe(*args: str) -> str:
+    result = CliRunner().invoke(services.services, ["describe", "trading-api", *args])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_sparkline_scales_values() -> None:
+    assert services.sparkline([1, 2, 3, 4, 5, 6, 7, 8]) == "▁▂▃▄▅▆▇█"
+
+
+def test_sparkline_skips_non_finite_values() -> None:
+    assert services.sparkline([1.0, math.inf, math.nan, 2.0]) == "▁█"
+    assert services.sparkline([math.inf, math.inf]) == ""
+
+
+def test_describe_renders_infinite_latency(prometheus: FakePrometheus) -> None:
+    output = describe()
+
+    assert "1.00 cores" in output
+    assert "n/a" in output
+    assert "Healthy" not in output
+    assert output.count("Reporting") == 3
+
+
+def test_describe_reports_unreachable_prometheus(prometheus: FakePrometheus) -> None:
+    prometheus.fail = True
+    output = describe()
+
+    assert output.count("Unavailable") == 3
+    assert "Prometheus unreachable" in output
+
+
+def test_queries_escape_service_name() -> None:
+    queries = dict(services.metric_queries('a.b"c', "dev"))
+
+    assert 'pod=~"a\\\\.b\\"c-.*"' in queries["CPU"]
+    assert 'service="a.b\\"c"' in queries["Requests"]
+
+
+def test_refresh_drops_only_queried_series(
+    prometheus: FakePrometheus, tmp_path: Path
+) -> None:
+    other = tmp_path / "other.ts"
+    other.write_bytes(b"")
+    describe()
+    prometheus.queries.clear()
+
+    describe("--refresh")
+
+    assert other.exists()
+    # Every dropped series is fetched again in full
+    assert len(prometheus.queries) == len(services.METRIC_QUERIES) * 3
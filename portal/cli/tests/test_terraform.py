@@ -0,0 +1,169 @@
+"""Tests for Terraform resource planning."""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from finops import terraform
+from finops.cli import main
+
+
+class FakeTerraform:
+    """``subprocess.run`` stand-in that records Terraform invocations."""
+
+    def __init__(self, plan_exit: int = 2, delay: float = 0.0) -> None:
+        self.plan_exit = plan_exit
+        self.delay = delay
+        self.calls: list[tuple[str, Path]] = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, args: list[str], cwd: Path, **kwargs: Any) -> subprocess.CompletedProcess:
+        command = args[1]
+        with self.lock:
+            self.calls.append((command, Path(cwd)))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+
+        if command == "init":
+            (Path(cwd) / ".terraform").mkdir(exist_ok=True)
+            return subprocess.CompletedProcess(args, 0, "", "")
+        stdout = "Plan: 1 to add, 0 to change, 0 to destroy." if self.plan_exit == 2 else ""
+        stderr = "Error: invalid configuration" if self.plan_exit == 1 else ""
+        return subprocess.CompletedProcess(args, self.plan_exit, stdout, stderr)
+
+    def commands(self, command: str) -> list[Path]:
+        return [cwd for name, cwd in self.calls if name == command]
+
+
+@pytest.fixture(autouse=True)
+def workspace_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(terraform, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(terraform, "WORKSPACE_DIR", tmp_path / "workspaces")
+    monkeypatch.setattr(terraform, "PLUGIN_CACHE_DIR", tmp_path / "plugins")
+    monkeypatch.setattr(terraform, "PROVIDER_MIRROR", None)
+    monkeypatch.setattr(terraform, "MODULES_DIR", None)
+    return tmp_path / "workspaces"
+
+
+@pytest.fixture
+def fake_terraform(monkeypatch: pytest.MonkeyPatch) -> FakeTerraform:
+    fake = FakeTerraform()
+    monkeypatch.setattr(terraform.subprocess, "run", fake)
+    return fake
+
+
+def test_render_config_uses_registry_module() -> None:
+    config = terraform.render_config("orders-db", "database")
+
+    block = config["module"]["orders_db"]
+    assert block["source"] == "terraform-aws-modules/rds/aws"
+    assert block["version"] == "~> 6.0"
+    assert block["identifier"] == "orders-db"
+
+
+def test_render_config_uses_local_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(terraform, "MODULES_DIR", "/opt/modules")
+
+    block = terraform.render_config("sessions", "cache")["module"]["sessions"]
+    assert block["source"] == "/opt/modules/cache"
+    assert "version" not in block
+
+
+def test_cache_creates_single_cluster() -> None:
+    block = terraform.render_config("sessions", "cache")["module"]["sessions"]
+
+    assert block["create_cluster"] is True
+    assert block["create_replication_group"] is False
+
+
+def test_database_sets_master_user() -> None:
+    block = terraform.render_config("orders-db", "database")["module"]["orders_db"]
+
+    assert block["username"] == "finops"
+    assert block["db_name"] == "orders_db"
+
+
+def test_init_is_skipped_for_unchanged_workspace(
+    fake_terraform: FakeTerraform, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    terraform.plan_resources(["sessions"], "cache", 1)
+    terraform.plan_resources(["sessions"], "cache", 1)
+    assert len(fake_terraform.commands("init")) == 1
+    assert len(fake_terraform.commands("plan")) == 2
+
+    monkeypatch.setattr(terraform, "AWS_REGION", "eu-west-1")
+    terraform.plan_resources(["sessions"], "cache", 1)
+    assert len(fake_terraform.commands("init")) == 2
+
+
+@pytest.mark.parametrize(
+    ("exit_code", "ok", "summary"),
+    [
+        (0, True, "No changes."),
+        (2, True, "Plan: 1 to add, 0 to change, 0 to destroy."),
+        (1, False, "plan failed"),
+        (-9, False, "plan failed"),
+    ],
+)
+def test_plan_exit_codes(
+    fake_terraform: FakeTerraform, exit_code: int, ok: bool, summary: str
+) -> None:
+    fake_terraform.plan_exit = exit_code
+
+    [result] = terraform.plan_resources(["events"], "queue", 1)
+    assert (result.ok, result.summary) == (ok, summary)
+
+
+def test_jobs_bound_concurrent_plans(fake_terraform: FakeTerraform) -> None:
+    names = [f"bucket-{i}" for i in range(6)]
+    terraform.plan_resources(names, "storage", 2)
+
+    fake_terraform.calls.clear()
+    fake_terraform.max_running = 0
+    fake_terraform.delay = 0.05
+    results = terraform.plan_resources(names, "storage", 2)
+
+    assert [result.name for result in results] == names
+    assert fake_terraform.max_running == 2
+
+
+def test_duplicate_names_share_one_plan(fake_terraform: FakeTerraform) -> None:
+    results = terraform.plan_resources(["cache-a", "cache-a"], "cache", 2)
+
+    assert len(results) == 1
+    assert len(fake_terraform.commands("plan")) == 1
+
+
+def test_error_in_one_workspace_keeps_other_results(
+    fake_terraform: FakeTerraform, workspace_dir: Path
+) -> None:
+    workspace_dir.mkdir(parents=True)
+    (workspace_dir / "queue-broken").write_text("not a directory")
+
+    results = terraform.plan_resources(["events", "broken"], "queue", 2)
+
+    assert [(result.name, result.ok) for result in results] == [("events", True), ("broken", False)]
+
+
+@pytest.mark.parametrize("name", ["../../escape", "1db", "Orders"])
+def test_cli_rejects_invalid_names(name: str) -> None:
+    result = CliRunner().invoke(main, ["create", "resource", name, "--type", "cache"])
+
+    assert result.exit_code == 2
+    assert "must start with a letter" in result.output
+
+
+def test_cli_rejects_zero_jobs() -> None:
+    result = CliRunner().invoke(main, ["create", "resource", "a", "--type", "cache", "-j", "0"])
+
+    assert result.exit_code == 2